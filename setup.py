@@ -48,6 +48,9 @@ setuptools.setup(
         "requests",
         "jprops",
     ],
+    extras_require={
+        "fast": ["orjson"],
+    },
     classifiers=[
         "Programming Language :: Python :: 3",
         "License :: OSI Approved :: GNU Lesser General Public License v3 or later (LGPLv3+)",
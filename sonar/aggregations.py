@@ -22,7 +22,6 @@
     Parent class of applications and portfolios
 
 """
-import json
 import sonar.components as comp
 from sonar import utilities, measures
 from sonar.audit import rules, problem
@@ -48,7 +47,7 @@ class Aggregation(comp.Component):
     def nbr_projects(self):
         if self._nbr_projects is None:
             self._nbr_projects = 0
-            data = json.loads(self.get("measures/component", params={"component": self.key, "metricKeys": "projects,ncloc"},).text)[
+            data = self.get("measures/component", params={"component": self.key, "metricKeys": "projects,ncloc"},).json()[
                 "component"
             ]["measures"]
             for m in data:
@@ -86,5 +85,5 @@ def count(api, endpoint, params=None):
     if params is None:
         params = {}
     params["ps"] = 1
-    data = json.loads(endpoint.get(api, params=params).text)
+    data = endpoint.get(api, params=params).json()
     return data["paging"]["total"]
@@ -18,7 +18,6 @@
 # Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
 #
 
-import json
 from http import HTTPStatus
 from requests.exceptions import HTTPError
 from sonar import components, exceptions, settings
@@ -66,7 +65,7 @@ class Application(aggr.Aggregation):
         if key in _OBJECTS:
             return _OBJECTS[key]
         try:
-            data = json.loads(endpoint.get(APIS["get"], params={"application": key}).text)
+            data = endpoint.get(APIS["get"], params={"application": key}).json()
         except HTTPError as e:
             if e.response.status_code == HTTPStatus.NOT_FOUND:
                 raise exceptions.ObjectNotFound(key, f"Application '{key}' not found")
@@ -130,7 +129,7 @@ class Application(aggr.Aggregation):
         :rtype: Appplication
         """
         try:
-            return self.reload(json.loads(self.get(APIS["get"], params={"application": self.key}).text)["application"])
+            return self.reload(self.get(APIS["get"], params={"application": self.key}).json()["application"])
         except HTTPError as e:
             if e.response.status_code == HTTPStatus.NOT_FOUND:
                 _OBJECTS.pop(self.key, None)
@@ -231,7 +230,7 @@ class Application(aggr.Aggregation):
                 br.pop("isMain")
             b_name = br.pop("name")
             params["branch"] = b_name
-            data = json.loads(self.get(APIS["get"], params=params).text)
+            data = self.get(APIS["get"], params=params).json()
             br["projects"] = {}
             for proj in data["application"]["projects"]:
                 br["projects"][proj["key"]] = proj["branch"]
@@ -383,7 +382,7 @@ def count(endpoint):
     :return: Count of applications
     :rtype: int
     """
-    data = json.loads(endpoint.get(components.SEARCH_API, params={"ps": 1, "filter": "qualifier = APP"}).text)
+    data = endpoint.get(components.SEARCH_API, params={"ps": 1, "filter": "qualifier = APP"}).json()
     return data["paging"]["total"]
 
 
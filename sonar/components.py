@@ -23,7 +23,6 @@
 
 """
 
-import json
 import sonar.sqobject as sq
 from sonar import settings, tasks
 import sonar.utilities as util
@@ -67,7 +66,7 @@ class Component(sq.SqObject):
         elif self._json is not None and "tags" in self._json:
             self._tags = self._json["tags"]
         else:
-            data = json.loads(self.get(_DETAILS_API, params={"component": self.key}).text)
+            data = self.get(_DETAILS_API, params={"component": self.key}).json()
             if self._json is None:
                 self._json = data["component"]
             else:
@@ -83,7 +82,7 @@ class Component(sq.SqObject):
             "ps": 1,
             "metricKeys": "bugs,vulnerabilities,code_smells,security_hotspots",
         }
-        data = json.loads(self.get("measures/component_tree", params=parms).text)
+        data = self.get("measures/component_tree", params=parms).json()
         nb_comp = data["paging"]["total"]
         util.logger.debug("Found %d subcomponents to %s", nb_comp, str(self))
         nb_pages = (nb_comp + 500 - 1) // 500
@@ -91,7 +90,7 @@ class Component(sq.SqObject):
         parms["ps"] = 500
         for page in range(nb_pages):
             parms["p"] = page + 1
-            data = json.loads(self.get("measures/component_tree", params=parms).text)
+            data = self.get("measures/component_tree", params=parms).json()
             for d in data["components"]:
                 nbr_issues = 0
                 for m in d["measures"]:
@@ -151,7 +150,7 @@ class Component(sq.SqObject):
         return self.ncloc
 
     def refresh(self):
-        return self.reload(json.loads(self.endpoint.get("navigation/component", params={"component": self.key}).text))
+        return self.reload(self.endpoint.get("navigation/component", params={"component": self.key}).json())
 
     def last_analysis(self):
         if not self._last_analysis:
@@ -172,6 +171,10 @@ class Component(sq.SqObject):
         self._visibility = visibility
 
     def _audit_bg_task(self, audit_settings):
+        if not audit_settings.get("audit.projects.exclusions", True):
+            # The background task audit is disabled, don't even search for the last task
+            util.logger.debug("Auditing of last background task of %s disabled, skipping...", str(self))
+            return []
         util.logger.debug("Auditing last background task of %s", str(self))
         last_task = tasks.search_last(component_key=self.key, endpoint=self.endpoint)
         if last_task:
@@ -181,7 +184,7 @@ class Component(sq.SqObject):
 
 
 def get_components(component_types, endpoint):
-    data = json.loads(endpoint.get("projects/search", params={"ps": 500, "qualifiers": component_types}).text)
+    data = endpoint.get("projects/search", params={"ps": 500, "qualifiers": component_types}).json()
     return data["components"]
 
 
@@ -22,7 +22,6 @@
     Abstraction of the SonarQube "custom measure" concept
 
 """
-import json
 import sonar.sqobject as sq
 
 
@@ -66,7 +65,7 @@ class CustomMeasure(sq.SqObject):
 
 
 def search(endpoint, project_key):
-    data = json.loads(endpoint.get(CustomMeasure.API_ROOT + "search", params={"projectKey": project_key, "ps": 500}).text)
+    data = endpoint.get(CustomMeasure.API_ROOT + "search", params={"projectKey": project_key, "ps": 500}).json()
     # nbr_measures = data['total'] if > 500, we're screwed...
     measures = []
     for m in data["customMeasures"]:
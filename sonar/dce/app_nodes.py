@@ -44,7 +44,7 @@ class AppNode(dce_nodes.DceNode):
         return f"App Node '{self.name()}'"
 
     def plugins(self):
-        self.json.get("Plugins", None)
+        return self.json.get("Plugins", None)
 
     def health(self):
         return self.json.get("Health", "RED")
@@ -140,7 +140,7 @@ class AppNode(dce_nodes.DceNode):
     def __audit_version(self):
         sq_version = self.version()
         if sq_version is None:
-            util.logger.warning("%s: Version information is missing, audit on node vresion is skipped...")
+            util.logger.warning("%s: Version information is missing, audit on node version is skipped...", str(self))
             return []
         st_time = self.sif.start_time()
         if (
@@ -221,34 +221,33 @@ class AppNode(dce_nodes.DceNode):
 
 
 def audit(sub_sif, sif):
-    nodes = []
-    problems = []
-    for n in sub_sif:
-        nodes.append(AppNode(n, sif))
+    nodes = [AppNode(n, sif) for n in sub_sif]
     if len(nodes) == 1:
         rule = rules.get_rule(rules.RuleId.DCE_APP_CLUSTER_NOT_HA)
         return [pb.Problem(rule.type, rule.severity, rule.msg)]
-    for i in range(len(nodes)):
-        problems += nodes[i].audit()
-        for j in range(i, len(nodes)):
-            v1 = nodes[i].version()
-            v2 = nodes[j].version()
-            if v1 is not None and v2 is not None and v1 != v2:
+    problems = []
+    # Versions and plugin lists are computed once per node, not once per node pair
+    versions = [n.version() for n in nodes]
+    plugins = [n.plugins() for n in nodes]
+    for i, node in enumerate(nodes):
+        problems += node.audit()
+        for j in range(i + 1, len(nodes)):
+            if versions[i] is not None and versions[j] is not None and versions[i] != versions[j]:
                 rule = rules.get_rule(rules.RuleId.DCE_DIFFERENT_APP_NODES_VERSIONS)
                 problems.append(
                     pb.Problem(
                         rule.type,
                         rule.severity,
-                        rule.msg.format(str(nodes[i]), str(nodes[j])),
+                        rule.msg.format(str(node), str(nodes[j])),
                     )
                 )
-            if nodes[i].plugins() != nodes[j].plugins():
+            if plugins[i] != plugins[j]:
                 rule = rules.get_rule(rules.RuleId.DCE_DIFFERENT_APP_NODES_PLUGINS)
                 problems.append(
                     pb.Problem(
                         rule.type,
                         rule.severity,
-                        rule.msg.format(str(nodes[i]), str(nodes[j])),
+                        rule.msg.format(str(node), str(nodes[j])),
                     )
                 )
     return problems
@@ -20,7 +20,6 @@
 
 
 from http import HTTPStatus
-import json
 
 from requests.exceptions import HTTPError
 
@@ -53,7 +52,7 @@ class DevopsPlatform(sqobject.SqObject):
     def read(cls, endpoint, key):
         if key in _OBJECTS:
             return _OBJECTS[key]
-        data = json.loads(endpoint.get(APIS["list"]).text)
+        data = endpoint.get(APIS["list"]).json()
         for plt_type, platforms in data.items():
             for p in platforms:
                 if p["key"] == key:
@@ -127,7 +126,7 @@ class DevopsPlatform(sqobject.SqObject):
         :return: Whether the operation succeeded
         :rtype: bool
         """
-        data = json.loads(self.get(APIS["list"]).text)
+        data = self.get(APIS["list"]).json()
         for alm_data in data.get(self.type, {}):
             if alm_data["key"] != self.key:
                 self._json = alm_data
@@ -201,7 +200,7 @@ def get_list(endpoint):
     """
     if endpoint.edition() == "community":
         return _OBJECTS
-    data = json.loads(endpoint.get(APIS["list"]).text)
+    data = endpoint.get(APIS["list"]).json()
     for alm_type in DEVOPS_PLATFORM_TYPES:
         for alm_data in data.get(alm_type, {}):
             DevopsPlatform.load(endpoint, alm_type, alm_data)
@@ -19,7 +19,6 @@
 #
 """Abstraction of the SonarQube "hotspot" concept"""
 
-import json
 import re
 import requests.utils
 import sonar.utilities as util
@@ -119,7 +118,7 @@ class Hotspot(findings.Finding):
         """
         resp = self.get("hotspots/show", {"hotspot": self.key})
         if resp.ok:
-            self.__details = json.loads(resp.text)
+            self.__details = resp.json()
         return resp.ok
 
     def __mark_as(self, resolution, comment=None):
@@ -383,7 +382,7 @@ def search(endpoint, page=None, params=None):
         else:
             new_params["p"] = page
         resp = endpoint.get("hotspots/search", params=new_params)
-        data = json.loads(resp.text)
+        data = resp.json()
         nbr_hotspots = data["paging"]["total"]
         nbr_pages = (nbr_hotspots + 499) // 500
         util.logger.debug(
@@ -697,7 +697,7 @@ def __search_thread(queue):
         page_params = params.copy()
         page_params["p"] = page
         util.logger.debug("Threaded issue search params = %s", str(page_params))
-        data = json.loads(endpoint.get(api, params=page_params).text)
+        data = endpoint.get(api, params=page_params).json()
         for i in data["issues"]:
             i["branch"] = page_params.get("branch", None)
             i["pullRequest"] = page_params.get("pullRequest", None)
@@ -712,7 +712,7 @@ def search_first(endpoint, **params):
     :rtype: Issue or None if not issue found
     """
     params["ps"] = 1
-    data = json.loads(endpoint.get(Issue.SEARCH_API, params=params).text)
+    data = endpoint.get(Issue.SEARCH_API, params=params).json()
     if len(data) == 0:
         return None
     i = data["issues"][0]
@@ -738,7 +738,7 @@ def search(endpoint, params=None, raise_error=True, threads=8):
         new_params["ps"] = Issue.MAX_PAGE_SIZE
     issue_list = {}
 
-    data = json.loads(endpoint.get(Issue.SEARCH_API, params=new_params).text)
+    data = endpoint.get(Issue.SEARCH_API, params=new_params).json()
     nbr_issues = data["paging"]["total"]
     nbr_pages = util.nbr_pages(data)
     util.logger.debug("Number of issues: %d - Nbr pages: %d", nbr_issues, nbr_pages)
@@ -769,7 +769,7 @@ def _get_facets(project_key, facets="directories", endpoint=None, params=None):
     new_params = {} if params is None else params.copy()
     new_params.update({"componentKeys": project_key, "facets": facets, "ps": 500})
     new_params = __get_issues_search_params(new_params)
-    data = json.loads(endpoint.get(Issue.SEARCH_API, params=new_params).text)
+    data = endpoint.get(Issue.SEARCH_API, params=new_params).json()
     l = {}
     facets_list = util.csv_to_list(facets)
     for f in data["facets"]:
@@ -19,7 +19,6 @@
 # Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
 #
 
-import json
 from sonar import sqobject, rules
 
 #: List of language APIs
@@ -70,7 +69,7 @@ def read_list(endpoint):
     :return: List of languages
     :rtype: dict{<language_key>: <language_name>}
     """
-    data = json.loads(endpoint.get(APIS["list"]).text)
+    data = endpoint.get(APIS["list"]).json()
     for lang in data["languages"]:
         _OBJECTS[lang["key"]] = lang["name"]
     return _OBJECTS
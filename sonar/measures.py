@@ -71,7 +71,7 @@ class Measure(sq.SqObject):
         if params is None:
             params = {}
         params.update({"component": project_key, "metrics": self.metric, "ps": 1})
-        data = json.loads(self.get(Measure.API_HISTORY, params=params).text)
+        data = self.get(Measure.API_HISTORY, params=params).json()
         return data["paging"]["total"]
 
     def search_history(self, project_key, params=None):
@@ -122,7 +122,7 @@ def get(concerned_object, metrics_list, **kwargs):
     params["metricKeys"] = util.list_to_csv(metrics_list)
     util.logger.debug("Getting measures with %s", str(params))
 
-    data = json.loads(concerned_object.endpoint.get(Measure.API_READ, params={**kwargs, **params}).text)
+    data = concerned_object.endpoint.get(Measure.API_READ, params={**kwargs, **params}).json()
     m_dict = {m: None for m in metrics_list}
     for m in data["component"]["measures"]:
         m_dict[m["metric"]] = Measure.load(data=m, concerned_object=concerned_object)
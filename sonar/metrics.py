@@ -18,7 +18,6 @@
 # Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
 #
 
-import json
 from sonar import sqobject, utilities
 
 #: List of what can be considered the main metrics
@@ -153,7 +152,7 @@ def search(endpoint, show_hidden_metrics=False):
         m_list = {}
         page, nb_pages = 1, 1
         while page <= nb_pages:
-            data = json.loads(endpoint.get(APIS["search"], params={"ps": __MAX_PAGE_SIZE, "p": page}).text)
+            data = endpoint.get(APIS["search"], params={"ps": __MAX_PAGE_SIZE, "p": page}).json()
             for m in data["metrics"]:
                 m_list[m["key"]] = Metric(key=m["key"], endpoint=endpoint, data=m)
             nb_pages = utilities.nbr_pages(data)
@@ -18,7 +18,6 @@
 # Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
 #
 
-import json
 from sonar import sqobject, utilities
 from sonar.permissions import template_permissions
 
@@ -190,7 +189,7 @@ def create(name, endpoint=None, create_data=None):
 def search(endpoint, params=None):
     utilities.logger.debug("Searching all permission templates")
     objects_list = {}
-    data = json.loads(endpoint.get(_SEARCH_API, params=params).text)
+    data = endpoint.get(_SEARCH_API, params=params).json()
     for obj in data["permissionTemplates"]:
         o = PermissionTemplate(name=obj["name"], endpoint=endpoint, data=obj)
         objects_list[o.key] = o
@@ -208,7 +207,7 @@ def get_list(endpoint):
 
 def _load_default_templates(data=None, endpoint=None):
     if data is None:
-        data = json.loads(endpoint.get(_SEARCH_API).text)
+        data = endpoint.get(_SEARCH_API).json()
     for d in data["defaultTemplates"]:
         _DEFAULT_TEMPLATES[d["qualifier"]] = d["templateId"]
 
@@ -18,7 +18,6 @@
 # Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
 #
 
-import json
 from http import HTTPStatus
 from abc import ABC, abstractmethod
 from sonar import utilities, options
@@ -209,17 +208,11 @@ class Permissions(ABC):
         :return: The number of permissions.
         :rtype: int
         """
-        perms = PERMISSION_TYPES if perm_type is None else (perm_type)
-        elem_counter, perm_counter = 0, 0
-        for ptype in perms:
-            for elem_perms in self.permissions.get(ptype, {}).values():
-                elem_counter += 1
-                if perm_filter is None:
-                    continue
-                for p in elem_perms:
-                    if p in perm_filter:
-                        perm_counter += 1
-        return elem_counter if perm_filter is None else perm_counter
+        perms = PERMISSION_TYPES if perm_type is None else (perm_type,)
+        if perm_filter is None:
+            return sum(len(self.permissions.get(ptype, {})) for ptype in perms)
+        wanted = frozenset(utilities.csv_to_list(perm_filter) if isinstance(perm_filter, str) else perm_filter)
+        return sum(len(wanted.intersection(elem_perms)) for ptype in perms for elem_perms in self.permissions.get(ptype, {}).values())
 
     def _get_api(self, api, perm_type, ret_field, **extra_params):
         perms = {}
@@ -229,20 +222,21 @@ class Permissions(ABC):
         while page <= nbr_pages:
             params["p"] = page
             resp = self.endpoint.get(api, params=params)
-            if resp.ok:
-                data = json.loads(resp.text)
-                # perms.update({p[ret_field]: p["permissions"] for p in data[perm_type]})
-                for p in data[perm_type]:
-                    if len(p["permissions"]) > 0:
-                        perms[p[ret_field]] = p["permissions"]
-                        counter = 0
-                    else:
-                        counter += 1
-            elif resp.status_code not in (HTTPStatus.BAD_REQUEST, HTTPStatus.NOT_FOUND):
-                # Hack: Different versions of SonarQube return different codes (400 or 404)
-                utilities.exit_fatal(f"HTTP error {resp.status_code} - Exiting", options.ERR_SONAR_API)
+            if not resp.ok:
+                if resp.status_code not in (HTTPStatus.BAD_REQUEST, HTTPStatus.NOT_FOUND):
+                    # Hack: Different versions of SonarQube return different codes (400 or 404)
+                    utilities.exit_fatal(f"HTTP error {resp.status_code} - Exiting", options.ERR_SONAR_API)
+                break
+            data = resp.json()
+            # perms.update({p[ret_field]: p["permissions"] for p in data[perm_type]})
+            for p in data[perm_type]:
+                if len(p["permissions"]) > 0:
+                    perms[p[ret_field]] = p["permissions"]
+                    counter = 0
+                else:
+                    counter += 1
             page, nbr_pages = page + 1, utilities.nbr_pages(data)
-            if counter > 5 or not resp.ok:
+            if counter > 5:
                 break
         return perms
 
@@ -18,7 +18,6 @@
 # Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
 #
 
-import json
 from http import HTTPStatus
 from sonar import utilities, options
 from sonar.permissions import permissions
@@ -66,7 +65,7 @@ class QualityPermissions(permissions.Permissions):
             params["p"] = page
             resp = self.endpoint.get(api, params=params)
             if resp.ok:
-                data = json.loads(resp.text)
+                data = resp.json()
                 perms += [p[ret_field] for p in data[perm_type]]
             elif resp.status_code not in (HTTPStatus.BAD_REQUEST, HTTPStatus.NOT_FOUND):
                 # Hack: Different versions of SonarQube return different codes (400 or 404)
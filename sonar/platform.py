@@ -22,12 +22,15 @@ from http import HTTPStatus
 import sys
 import os
 import time
+import logging
 import datetime
-import json
 import tempfile
+from urllib.parse import urlencode
 import requests
 import jprops
+from requests.adapters import HTTPAdapter
 from requests.exceptions import HTTPError
+from urllib3.util.retry import Retry
 
 import sonar.utilities as util
 
@@ -48,6 +51,11 @@ _HTTP_ERROR = "%s Error: %s HTTP status code %d"
 _SONAR_TOOLS_AGENT = {"user-agent": f"sonar-tools {version.PACKAGE_VERSION}"}
 _UPDATE_CENTER = "https://raw.githubusercontent.com/SonarSource/sonar-update-center-properties/master/update-center-source.properties"
 
+# Connect and read timeouts, in seconds, for all HTTP requests to SonarQube
+_HTTP_TIMEOUT = (5, 60)
+# Retry policy for transient HTTP failures (only on idempotent methods, POST is never retried)
+_HTTP_RETRIES = Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+
 LTS = None
 LATEST = None
 _HARDCODED_LTS = (8, 9, 9)
@@ -71,7 +79,18 @@ class Platform:
         """
         self.url = some_url  #: SonarQube URL
         self.__token = some_token
+        self.__redacted_token = util.redacted_token(some_token)
         self.__cert_file = cert_file
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=_HTTP_RETRIES)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+        # Set once on the session rather than per call: requests merges these for every
+        # request, which is pure overhead in tight polling loops
+        self._session.auth = self.__credentials()
+        self._session.headers.update(_SONAR_TOOLS_AGENT)
+        if cert_file is not None:
+            self._session.verify = cert_file
         self._version = None
         self.__sys_info = None
         self.__global_nav = None
@@ -83,7 +102,7 @@ class Platform:
         :return: string representation of the SonarQube connection, with the token recognizable but largely redacted
         :rtype: str
         """
-        return f"{util.redacted_token(self.__token)}@{self.url}"
+        return f"{self.__redacted_token}@{self.url}"
 
     def __credentials(self):
         return (self.__token, "")
@@ -101,11 +120,11 @@ class Platform:
         if digits < 1 or digits > 3:
             digits = 3
         if self._version is None:
-            self._version = self.get("/api/server/version").text.split(".")
+            self._version = tuple(int(n) for n in self.get("/api/server/version").text.split(".")[0:3])
         if as_string:
-            return ".".join(self._version[0:digits])
+            return ".".join(str(n) for n in self._version[0:digits])
         else:
-            return tuple(int(n) for n in self._version[0:digits])
+            return self._version[0:digits]
 
     def edition(self):
         """
@@ -127,7 +146,7 @@ class Platform:
         if self.__sys_info is not None and "Server ID" in self.__sys_info["System"]:
             self._server_id = self.__sys_info["System"]["Server ID"]
         else:
-            self._server_id = json.loads(self.get("system/status").text)["id"]
+            self._server_id = self.get("system/status").json()["id"]
         return self._server_id
 
     def basics(self):
@@ -156,23 +175,7 @@ class Platform:
         :return: the result of the HTTP request
         :rtype: request.Response
         """
-        api = _normalize_api(api)
-        util.logger.debug("GET: %s", self.__urlstring(api, params))
-        try:
-            r = requests.get(url=self.url + api, auth=self.__credentials(), verify=self.__cert_file, headers=_SONAR_TOOLS_AGENT, params=params)
-            r.raise_for_status()
-        except requests.exceptions.HTTPError as e:
-            if exit_on_error or r.status_code in (HTTPStatus.UNAUTHORIZED, HTTPStatus.FORBIDDEN):
-                util.log_and_exit(r)
-            else:
-                if r.status_code in mute:
-                    util.logger.debug(_HTTP_ERROR, "GET", self.__urlstring(api, params), r.status_code)
-                else:
-                    util.logger.error(_HTTP_ERROR, "GET", self.__urlstring(api, params), r.status_code)
-                raise e
-        except requests.RequestException as e:
-            util.exit_fatal(str(e), options.ERR_SONAR_API)
-        return r
+        return self.__request("GET", api, params=params, exit_on_error=exit_on_error, mute=mute)
 
     def post(self, api, params=None, exit_on_error=False, mute=()):
         """Makes an HTTP POST request to SonarQube
@@ -189,23 +192,7 @@ class Platform:
         :return: the result of the HTTP request
         :rtype: request.Response
         """
-        api = _normalize_api(api)
-        util.logger.debug("POST: %s", self.__urlstring(api, params))
-        try:
-            r = requests.post(url=self.url + api, auth=self.__credentials(), verify=self.__cert_file, headers=_SONAR_TOOLS_AGENT, data=params)
-            r.raise_for_status()
-        except requests.exceptions.HTTPError:
-            if exit_on_error or r.status_code in (HTTPStatus.UNAUTHORIZED, HTTPStatus.FORBIDDEN):
-                util.log_and_exit(r)
-            else:
-                if r.status_code in mute:
-                    util.logger.debug(_HTTP_ERROR, "POST", self.__urlstring(api, params), r.status_code)
-                else:
-                    util.logger.error(_HTTP_ERROR, "POST", self.__urlstring(api, params), r.status_code)
-                raise
-        except requests.RequestException as e:
-            util.exit_fatal(str(e), options.ERR_SONAR_API)
-        return r
+        return self.__request("POST", api, params=params, exit_on_error=exit_on_error, mute=mute)
 
     def delete(self, api, params=None, exit_on_error=False, mute=()):
         """Makes an HTTP DELETE request to SonarQube
@@ -222,22 +209,30 @@ class Platform:
         :return: the result of the HTTP request
         :rtype: request.Response
         """
+        return self.__request("DELETE", api, params=params, exit_on_error=exit_on_error, mute=mute)
+
+    def __request(self, method, api, params=None, exit_on_error=False, mute=()):
+        """Makes an HTTP request to SonarQube, the method (GET, POST, DELETE) passed as parameter"""
         api = _normalize_api(api)
-        util.logger.debug("DELETE: %s", self.__urlstring(api, params))
+        params = _sanitize_params(params)
+        if util.logger.isEnabledFor(logging.DEBUG):
+            util.logger.debug("%s: %s", method, self.__urlstring(api, params))
+        kwargs = {"data" if method == "POST" else "params": params}
         try:
-            r = requests.delete(url=self.url + api, auth=self.__credentials(), verify=self.__cert_file, params=params, headers=_SONAR_TOOLS_AGENT)
+            r = self._session.request(method, url=self.url + api, timeout=_HTTP_TIMEOUT, **kwargs)
             r.raise_for_status()
-        except requests.exceptions.HTTPError:
-            if exit_on_error:
+        except requests.exceptions.HTTPError as e:
+            if exit_on_error or r.status_code in (HTTPStatus.UNAUTHORIZED, HTTPStatus.FORBIDDEN):
                 util.log_and_exit(r)
             else:
                 if r.status_code in mute:
-                    util.logger.debug(_HTTP_ERROR, "DELETE", self.__urlstring(api, params), r.status_code)
+                    util.logger.debug(_HTTP_ERROR, method, self.__urlstring(api, params), r.status_code)
                 else:
-                    util.logger.error(_HTTP_ERROR, "DELETE", self.__urlstring(api, params), r.status_code)
-                raise
+                    util.logger.error(_HTTP_ERROR, method, self.__urlstring(api, params), r.status_code)
+                raise e
         except requests.RequestException as e:
             util.exit_fatal(str(e), options.ERR_SONAR_API)
+        return r
 
     def global_permissions(self):
         """Returns the SonarQube platform global permissions
@@ -268,8 +263,7 @@ class Platform:
                         counter += 1
                     else:
                         raise e
-            self.__sys_info = json.loads(resp.text)
-            success = True
+            self.__sys_info = util.json_loads(resp.content)
         return self.__sys_info
 
     def global_nav(self):
@@ -279,7 +273,7 @@ class Platform:
         """
         if self.__global_nav is None:
             resp = self.get("navigation/global", mute=(HTTPStatus.INTERNAL_SERVER_ERROR,))
-            self.__global_nav = json.loads(resp.text)
+            self.__global_nav = resp.json()
         return self.__global_nav
 
     def database(self):
@@ -312,7 +306,7 @@ class Platform:
         """
         params = util.remove_nones({"keys": util.list_to_csv(settings_list)})
         resp = self.get("settings/values", params=params)
-        json_s = json.loads(resp.text)
+        json_s = util.json_loads(resp.content)
         platform_settings = {}
         for s in json_s["settings"]:
             if "value" in s:
@@ -361,19 +355,11 @@ class Platform:
 
     def __urlstring(self, api, params):
         """Returns a string corresponding to the URL and parameters"""
-        first = True
         url_prefix = f"{str(self)}{api}"
-        if params is None:
+        if not params:
             return url_prefix
-        for p in params:
-            if params[p] is None:
-                continue
-            sep = "?" if first else "&"
-            first = False
-            if isinstance(params[p], datetime.date):
-                params[p] = util.format_date(params[p])
-            url_prefix += f"{sep}{p}={requests.utils.quote(str(params[p]))}"
-        return url_prefix
+        query = urlencode({k: v for k, v in params.items() if v is not None})
+        return f"{url_prefix}?{query}" if query else url_prefix
 
     def webhooks(self):
         """
@@ -461,15 +447,12 @@ class Platform:
         problems = []
         platform_settings = self.get_settings()
         settings_url = f"{self.url}/admin/settings"
+        sq_version = self.version()
         for key in audit_settings:
-            if key.startswith("audit.globalSettings.range"):
-                problems += _audit_setting_in_range(key, platform_settings, audit_settings, self.version(), settings_url)
-            elif key.startswith("audit.globalSettings.value"):
-                problems += _audit_setting_value(key, platform_settings, audit_settings, settings_url)
-            elif key.startswith("audit.globalSettings.isSet"):
-                problems += _audit_setting_set(key, True, platform_settings, audit_settings, settings_url)
-            elif key.startswith("audit.globalSettings.isNotSet"):
-                problems += _audit_setting_set(key, False, platform_settings, audit_settings, settings_url)
+            for prefix, audit_func in _GLOBAL_SETTING_AUDITS:
+                if key.startswith(prefix):
+                    problems += audit_func(key, platform_settings, audit_settings, sq_version, settings_url)
+                    break
 
         pf_sif = self.sys_info()
         if self.version() >= (9, 7, 0):
@@ -495,10 +478,10 @@ class Platform:
                 "navigation/organization",
                 params={"organization": "default-organization"},
             )
-            visi = json.loads(resp.text)["organization"]["projectVisibility"]
+            visi = resp.json()["organization"]["projectVisibility"]
         else:
             resp = self.get("settings/values", params={"keys": "projects.default.visibility"})
-            visi = json.loads(resp.text)["settings"][0]["value"]
+            visi = resp.json()["settings"][0]["value"]
         util.logger.info("Project default visibility is '%s'", visi)
         if config.get_property("checkDefaultProjectVisibility") and visi != "private":
             rule = rules.get_rule(rules.RuleId.SETTING_PROJ_DEFAULT_VISIBILITY)
@@ -509,8 +492,8 @@ class Platform:
         util.logger.info("Auditing admin password")
         problems = []
         try:
-            r = requests.get(url=self.url + "/api/authentication/validate", auth=("admin", "admin"))
-            data = json.loads(r.text)
+            r = self._session.get(url=self.url + "/api/authentication/validate", auth=("admin", "admin"), timeout=_HTTP_TIMEOUT)
+            data = r.json()
             if data.get("valid", False):
                 rule = rules.get_rule(rules.RuleId.DEFAULT_ADMIN_PASSWORD)
                 problems.append(pb.Problem(rule.type, rule.severity, rule.msg, concerned_object=self.url))
@@ -591,6 +574,14 @@ this = sys.modules[__name__]
 this.context = Platform(os.getenv("SONAR_HOST_URL", "http://localhost:9000"), os.getenv("SONAR_TOKEN", ""))
 
 
+def _sanitize_params(params):
+    """Returns a copy of the params dict with dates formatted, leaving the caller's dict untouched"""
+    if params is None:
+        return None
+    date_cls, fmt = datetime.date, util.format_date
+    return {k: (fmt(v) if isinstance(v, date_cls) else v) for k, v in params.items()}
+
+
 def _normalize_api(api):
     api = api.lower()
     if api.startswith("/api"):
@@ -604,7 +595,7 @@ def _normalize_api(api):
     return api
 
 
-def _audit_setting_value(key, platform_settings, audit_settings, url):
+def _audit_setting_value(key, platform_settings, audit_settings, sq_version, url):
     v = _get_multiple_values(4, audit_settings[key], "MEDIUM", "CONFIGURATION")
     if v is None:
         util.logger.error(WRONG_CONFIG_MSG, key, audit_settings[key])
@@ -644,6 +635,14 @@ def _audit_setting_in_range(key, platform_settings, audit_settings, sq_version,
     ]
 
 
+def _audit_setting_is_set(key, platform_settings, audit_settings, sq_version, url):
+    return _audit_setting_set(key, True, platform_settings, audit_settings, url)
+
+
+def _audit_setting_is_not_set(key, platform_settings, audit_settings, sq_version, url):
+    return _audit_setting_set(key, False, platform_settings, audit_settings, url)
+
+
 def _audit_setting_set(key, check_is_set, platform_settings, audit_settings, url):
     v = _get_multiple_values(3, audit_settings[key], "MEDIUM", "CONFIGURATION")
     if v is None:
@@ -669,6 +668,16 @@ def _audit_setting_set(key, check_is_set, platform_settings, audit_settings, url
     return problems
 
 
+# Maps audit-settings key prefixes to their audit function, built once at import time.
+# All audit functions share the (key, platform_settings, audit_settings, sq_version, url) signature.
+_GLOBAL_SETTING_AUDITS = (
+    ("audit.globalSettings.range", _audit_setting_in_range),
+    ("audit.globalSettings.value", _audit_setting_value),
+    ("audit.globalSettings.isSet", _audit_setting_is_set),
+    ("audit.globalSettings.isNotSet", _audit_setting_is_not_set),
+)
+
+
 def _audit_maintainability_rating_range(value, range, rating_letter, severity, domain, url):
     util.logger.debug(
         "Checking that maintainability rating threshold %3.0f%% for '%s' is within recommended range [%3.0f%%-%3.0f%%]",
@@ -691,7 +700,7 @@ def _audit_maintainability_rating_range(value, range, rating_letter, severity, d
 
 
 def _audit_maintainability_rating_grid(platform_settings, audit_settings, url):
-    thresholds = util.csv_to_list(platform_settings["sonar.technicalDebt.ratingGrid"])
+    thresholds = [float(x) for x in util.csv_to_list(platform_settings["sonar.technicalDebt.ratingGrid"])]
     problems = []
     util.logger.debug("Auditing maintainabillity rating grid")
     for key in audit_settings:
@@ -701,7 +710,7 @@ def _audit_maintainability_rating_grid(platform_settings, audit_settings, url):
         if letter not in ["A", "B", "C", "D"]:
             util.logger.error("Incorrect audit configuration setting %s, skipping audit", key)
             continue
-        value = float(thresholds[ord(letter.upper()) - 65])
+        value = thresholds[ord(letter.upper()) - 65]
         v = _get_multiple_values(4, audit_settings[key], sev.Severity.MEDIUM, typ.Type.CONFIGURATION)
         if v is None:
             continue
@@ -24,7 +24,6 @@
 """
 
 import time
-import json
 from http import HTTPStatus
 from requests.exceptions import HTTPError
 
@@ -157,7 +156,7 @@ class Portfolio(aggregations.Aggregation):
 
     def refresh(self):
         util.logger.debug("Updating details for %s root key %s", str(self), self._root_portfolio)
-        data = json.loads(self.get(_GET_API, params={"key": self.root_portfolio().key}).text)
+        data = self.get(_GET_API, params={"key": self.root_portfolio().key}).json()
         if not self.is_sub_portfolio:
             self.reload(data)
         self.root_portfolio().create_sub_portfolios()
@@ -253,17 +252,15 @@ class Portfolio(aggregations.Aggregation):
         return self._tags
 
     def get_components(self):
-        data = json.loads(
-            self.get(
-                "measures/component_tree",
-                params={
-                    "component": self.key,
-                    "metricKeys": "ncloc",
-                    "strategy": "children",
-                    "ps": 500,
-                },
-            ).text
-        )
+        data = self.get(
+            "measures/component_tree",
+            params={
+                "component": self.key,
+                "metricKeys": "ncloc",
+                "strategy": "children",
+                "ps": 500,
+            },
+        ).json()
         comp_list = {}
         for c in data["components"]:
             comp_list[c["key"]] = c
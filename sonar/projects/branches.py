@@ -19,7 +19,6 @@
 #
 
 from http import HTTPStatus
-import json
 from urllib.parse import unquote
 from requests.exceptions import HTTPError
 import requests.utils
@@ -66,7 +65,7 @@ class Branch(components.Component):
         if _uuid in _OBJECTS:
             return _OBJECTS[_uuid]
         try:
-            data = json.loads(concerned_object.endpoint.get(APIS["list"], params={"project": concerned_object.key}).text)
+            data = concerned_object.endpoint.get(APIS["list"], params={"project": concerned_object.key}).json()
         except HTTPError as e:
             if e.response.status_code == HTTPStatus.NOT_FOUND:
                 raise exceptions.ObjectNotFound(concerned_object.key, f"Project '{concerned_object.key}' not found")
@@ -123,7 +122,7 @@ class Branch(components.Component):
         :rtype: Branch
         """
         try:
-            data = json.loads(self.get(APIS["list"], params={"project": self.concerned_object.key}).text)
+            data = self.get(APIS["list"], params={"project": self.concerned_object.key}).json()
         except HTTPError as e:
             if e.response.status_code == HTTPStatus.NOT_FOUND:
                 raise exceptions.ObjectNotFound(self.key, f"{str(self)} not found in SonarQube")
@@ -197,7 +196,7 @@ class Branch(components.Component):
         """
         if self._new_code is None:
             try:
-                data = json.loads(self.get(api=APIS["get_new_code"], params={"project": self.concerned_object.key}).text)
+                data = self.get(api=APIS["get_new_code"], params={"project": self.concerned_object.key}).json()
             except HTTPError as e:
                 if e.response.status_code == HTTPStatus.NOT_FOUND:
                     raise exceptions.ObjectNotFound(self.concerned_object.key, f"str{self.concerned_object} not found")
@@ -409,7 +408,7 @@ def get_list(project):
         raise exceptions.UnsupportedOperation(_UNSUPPORTED_IN_CE)
 
     util.logger.debug("Reading all branches of %s", str(project))
-    data = json.loads(project.endpoint.get(APIS["list"], params={"project": project.key}).text)
+    data = project.endpoint.get(APIS["list"], params={"project": project.key}).json()
     return [Branch.load(project, branch["name"], data=branch) for branch in data.get("branches", {})]
 
 
@@ -82,7 +82,7 @@ class Project(components.Component):
         """
         if key in _OBJECTS:
             return _OBJECTS[key]
-        data = json.loads(endpoint.get(_SEARCH_API, params={"projects": key}).text)
+        data = endpoint.get(_SEARCH_API, params={"projects": key}).json()
         if len(data["components"]) == 0:
             raise exceptions.ObjectNotFound(key, f"Project key {key} not found")
         return cls.load(endpoint, data["components"][0])
@@ -152,7 +152,7 @@ class Project(components.Component):
         :return: self
         :rtype: Project
         """
-        data = json.loads(self.get(_SEARCH_API, params={"projects": self.key}).text)
+        data = self.get(_SEARCH_API, params={"projects": self.key}).json()
         if len(data["components"]) == 0:
             _OBJECTS.pop(self.uuid(), None)
             raise exceptions.ObjectNotFound(self.key, f"Project key {self.key} not found")
@@ -302,7 +302,7 @@ class Project(components.Component):
             try:
                 resp = self.get("alm_settings/get_binding", params={"project": self.key}, mute=(HTTPStatus.NOT_FOUND,))
                 self._binding["has_binding"] = True
-                self._binding["binding"] = json.loads(resp.text)
+                self._binding["binding"] = resp.json()
             except HTTPError as e:
                 if e.response.status_code in (HTTPStatus.NOT_FOUND, HTTPStatus.BAD_REQUEST):
                     # Hack: 8.9 returns 404, 9.x returns 400
@@ -530,12 +530,12 @@ class Project(components.Component):
             resp = self.post("project_dump/export", params={"key": self.key})
         except HTTPError as e:
             return {"status": f"HTTP_ERROR {e.response.status_code}"}
-        data = json.loads(resp.text)
+        data = resp.json()
         status = tasks.Task(data["taskId"], endpoint=self.endpoint, concerned_object=self, data=data).wait_for_completion(timeout=timeout)
         if status != tasks.SUCCESS:
             util.logger.error("%s export %s", str(self), status)
             return {"status": status}
-        dump_file = json.loads(self.get("project_dump/status", params={"key": self.key}).text)["exportedDump"]
+        dump_file = self.get("project_dump/status", params={"key": self.key}).json()["exportedDump"]
         util.logger.debug("%s export %s, dump file %s", str(self), status, dump_file)
         return {"status": status, "file": dump_file}
 
@@ -547,7 +547,7 @@ class Project(components.Component):
         """
         util.logger.info("Exporting %s (asynchronously)", str(self))
         try:
-            return json.loads(self.post("project_dump/export", params={"key": self.key}).text)["taskId"]
+            return self.post("project_dump/export", params={"key": self.key}).json()["taskId"]
         except HTTPError:
             return None
 
@@ -584,7 +584,7 @@ class Project(components.Component):
         elif pr is not None:
             params["pullRequest"] = pr
 
-        data = json.loads(self.get("projects/export_findings", params=params).text)["export_findings"]
+        data = self.get("projects/export_findings", params=params).json()["export_findings"]
         findings_conflicts = {"SECURITY_HOTSPOT": 0, "BUG": 0, "CODE_SMELL": 0, "VULNERABILITY": 0}
         nbr_findings = {"SECURITY_HOTSPOT": 0, "BUG": 0, "CODE_SMELL": 0, "VULNERABILITY": 0}
         util.logger.debug(util.json_dump(data))
@@ -667,7 +667,7 @@ class Project(components.Component):
         :return: name of quality gate and whether it's the default
         :rtype: tuple(name, is_default)
         """
-        data = json.loads(self.get(api="qualitygates/get_by_project", params={"project": self.key}).text)
+        data = self.get(api="qualitygates/get_by_project", params={"project": self.key}).json()
         return (data["qualityGate"]["name"], data["qualityGate"]["default"])
 
     def webhooks(self):
@@ -683,7 +683,7 @@ class Project(components.Component):
         :return: list of project links
         :rtype: list[{type, name, url}]
         """
-        data = json.loads(self.get(api="project_links/search", params={"projectKey": self.key}).text)
+        data = self.get(api="project_links/search", params={"projectKey": self.key}).json()
         link_list = None
         for link in data["links"]:
             if link_list is None:
@@ -1289,7 +1289,7 @@ def export_zip(endpoint, key_list=None, threads=8, export_timeout=30):
     q = Queue(maxsize=0)
     for p in projects_list.values():
         q.put(p)
-    for i in range(threads):
+    for i in range(min(threads, nbr_projects)):
         util.logger.debug("Starting project export thread %d", i)
         worker = Thread(target=__export_zip_thread, args=(q, exports, statuses, export_timeout))
         worker.setDaemon(True)
@@ -23,7 +23,6 @@
 
 """
 
-import json
 import requests.utils
 from sonar import measures, components, sqobject
 import sonar.utilities as util
@@ -107,7 +106,7 @@ def get_list(project):
     if project.endpoint.edition() == "community":
         util.logger.debug("Pull requests not available in Community Edition")
         return []
-    data = json.loads(project.get("project_pull_requests/list", params={"project": project.key}).text)
+    data = project.get("project_pull_requests/list", params={"project": project.key}).json()
     pr_list = []
     for pr in data["pullRequests"]:
         pr_list.append(get_object(pr["key"], project, pr))
@@ -24,7 +24,6 @@
 """
 
 from http import HTTPStatus
-import json
 from requests.exceptions import HTTPError
 import sonar.sqobject as sq
 from sonar import measures, exceptions
@@ -160,7 +159,7 @@ class QualityGate(sq.SqObject):
             except HTTPError as e:
                 if e.response.status_code == HTTPStatus.NOT_FOUND:
                     raise exceptions.ObjectNotFound(self.name, f"{str(self)} not found")
-            data = json.loads(resp.text)
+            data = resp.json()
             for prj in data["results"]:
                 util.logger.info("Proj = %s", str(prj))
                 key = prj["key"] if "key" in prj else prj["id"]
@@ -185,7 +184,7 @@ class QualityGate(sq.SqObject):
         """
         if self._conditions is None:
             self._conditions = []
-            data = json.loads(self.get(APIS["details"], params={"name": self.name}).text)
+            data = self.get(APIS["details"], params={"name": self.name}).json()
             for c in data.get("conditions", []):
                 self._conditions.append(c)
         if encoded:
@@ -342,7 +341,7 @@ def get_list(endpoint):
     :rtype: dict {<name>: <QualityGate>}
     """
     util.logger.info("Getting quality gates")
-    data = json.loads(endpoint.get(APIS["list"]).text)
+    data = endpoint.get(APIS["list"]).json()
     qg_list = {}
     for qg in data["qualitygates"]:
         qg_obj = QualityGate(name=qg["name"], endpoint=endpoint, data=qg)
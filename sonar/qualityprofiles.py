@@ -18,7 +18,6 @@
 # Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
 #
 
-import json
 from http import HTTPStatus
 from queue import Queue
 from threading import Thread
@@ -311,7 +310,7 @@ class QualityProfile(sq.SqObject):
         :return: dict result of the compare ("inLeft", "inRight", "same", "modified")
         :rtype: dict
         """
-        data = json.loads(self.get("qualityprofiles/compare", params={"leftKey": self.key, "rightKey": another_qp.key}).text)
+        data = self.get("qualityprofiles/compare", params={"leftKey": self.key, "rightKey": another_qp.key}).json()
         for r in data["inLeft"] + data["same"] + data["inRight"] + data["modified"]:
             for k in ("name", "pluginKey", "pluginName", "languageKey", "languageName"):
                 r.pop(k, None)
@@ -345,7 +344,7 @@ class QualityProfile(sq.SqObject):
         more = True
         while more:
             params["p"] = page
-            data = json.loads(self.get("qualityprofiles/projects", params=params).text)
+            data = self.get("qualityprofiles/projects", params=params).json()
             self._projects += [p["key"] for p in data["results"]]
             more = data["more"]
             page += 1
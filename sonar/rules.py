@@ -22,7 +22,6 @@
     Abstraction of the SonarQube "rule" concept
 
 """
-import json
 from http import HTTPStatus
 from requests.exceptions import HTTPError
 import sonar.sqobject as sq
@@ -47,7 +46,7 @@ class Rule(sq.SqObject):
         except HTTPError as e:
             if e.response.status_code == HTTPStatus.NOT_FOUND:
                 raise exceptions.ObjectNotFound(key=key, message=f"Rule key '{key}' does not exist")
-        return Rule(key, endpoint, json.loads(r.text)["rule"])
+        return Rule(key, endpoint, r.json()["rule"])
 
     @classmethod
     def create(cls, key, endpoint, **kwargs):
@@ -128,7 +127,7 @@ class Rule(sq.SqObject):
 
 
 def get_facet(facet, endpoint):
-    data = json.loads(endpoint.get(SEARCH_API, params={"ps": 1, "facets": facet}).text)
+    data = endpoint.get(SEARCH_API, params={"ps": 1, "facets": facet}).json()
     facet_dict = {}
     for f in data["facets"][0]["values"]:
         facet_dict[f["val"]] = f["count"]
@@ -140,7 +139,7 @@ def search(endpoint, **params):
 
 
 def count(endpoint, **params):
-    return json.loads(endpoint.get(SEARCH_API, params={**params, "ps": 1}).text)["total"]
+    return endpoint.get(SEARCH_API, params={**params, "ps": 1}).json()["total"]
 
 
 def get_list(endpoint, **params):
@@ -98,11 +98,11 @@ class Setting(sqobject.SqObject):
             return _OBJECTS[uu]
         if key == NEW_CODE_PERIOD:
             params = get_component_params(component, name="project")
-            data = json.loads(endpoint.get(API_NEW_CODE_GET, params=params).text)
+            data = endpoint.get(API_NEW_CODE_GET, params=params).json()
         else:
             params = get_component_params(component)
             params.update({"keys": key})
-            data = json.loads(endpoint.get(_API_GET, params=params).text)["settings"][0]
+            data = endpoint.get(_API_GET, params=params).json()["settings"][0]
         return Setting.load(key=key, endpoint=endpoint, data=data, component=component)
 
     @classmethod
@@ -246,7 +246,7 @@ def get_bulk(endpoint, settings_list=None, component=None, include_not_set=False
     settings_dict = {}
     params = get_component_params(component)
     if include_not_set:
-        data = json.loads(endpoint.get(_API_LIST, params=params).text)
+        data = endpoint.get(_API_LIST, params=params).json()
         for s in data["definitions"]:
             if s["key"].endswith("coverage.reportPath") or s["key"] == "languageSpecificParameters":
                 continue
@@ -258,7 +258,7 @@ def get_bulk(endpoint, settings_list=None, component=None, include_not_set=False
         params["keys"] = util.list_to_csv(settings_list)
     else:
         params["keys"] = util.csv_normalize(settings_list)
-    data = json.loads(endpoint.get(_API_GET, params=params).text)
+    data = endpoint.get(_API_GET, params=params).json()
     settings_type_list = ["settings"]
     # Hack: Sonar API also return setSecureSettings for projects although it's irrelevant
     if component is None:
@@ -336,10 +336,10 @@ def get_visibility(endpoint, component):
     if uu in _OBJECTS:
         return _OBJECTS[uu]
     if component:
-        data = json.loads(endpoint.get("components/show", params={"component": component.key}).text)
+        data = endpoint.get("components/show", params={"component": component.key}).json()
         return Setting.load(key=COMPONENT_VISIBILITY, endpoint=endpoint, component=component, data=data["component"])
     else:
-        data = json.loads(endpoint.get(_API_GET, params={"keys": PROJECT_DEFAULT_VISIBILITY}).text)
+        data = endpoint.get(_API_GET, params={"keys": PROJECT_DEFAULT_VISIBILITY}).json()
         return Setting.load(key=PROJECT_DEFAULT_VISIBILITY, endpoint=endpoint, component=None, data=data["settings"][0])
 
 
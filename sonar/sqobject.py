@@ -23,7 +23,6 @@
 
 """
 
-import json
 from http import HTTPStatus
 from queue import Queue
 from threading import Thread
@@ -83,7 +82,7 @@ def __search_thread(queue):
         page_params = params.copy()
         page_params["p"] = page
         utilities.logger.debug("Threaded search: API = %s params = %s", api, str(params))
-        data = json.loads(endpoint.get(api, params=page_params).text)
+        data = endpoint.get(api, params=page_params).json()
         for obj in data[returned_field]:
             if object_class.__name__ in ("QualityProfile", "QualityGate", "Groups", "Portfolio", "Project"):
                 objects[obj[key_field]] = object_class.load(endpoint=endpoint, data=obj)
@@ -102,7 +101,7 @@ def search_objects(api, endpoint, key_field, returned_field, object_class, param
         new_params["ps"] = __MAX_SEARCH
     new_params["p"] = 1
     objects_list = {}
-    data = json.loads(endpoint.get(api, params=new_params).text)
+    data = endpoint.get(api, params=new_params).json()
     for obj in data[returned_field]:
         if object_class.__name__ in ("Portfolio", "Group", "QualityProfile", "User", "Application", "Project"):
             objects_list[obj[key_field]] = object_class.load(endpoint=endpoint, data=obj)
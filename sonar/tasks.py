@@ -20,7 +20,7 @@
 
 import time
 import datetime
-import json
+import random
 import re
 from sonar.audit import rules, problem
 import sonar.sqobject as sq
@@ -35,10 +35,22 @@ CANCELED = "CANCELED"
 TIMEOUT = "TIMEOUT"
 
 STATUSES = (SUCCESS, PENDING, IN_PROGRESS, FAILED, CANCELED)
+_STATUSES_JOINED = ",".join(STATUSES)
+
+# Background task polling backoff: start fast to catch short tasks quickly,
+# then grow exponentially up to a cap so long tasks don't hammer the API,
+# with a bit of jitter to avoid synchronized polling of concurrent waiters
+_POLL_INITIAL_INTERVAL = 0.2
+_POLL_BACKOFF_FACTOR = 1.3
+_POLL_MAX_INTERVAL = 10.0
+_POLL_JITTER = 0.2
 
 __SUSPICIOUS_EXCLUSIONS = None
 __SUSPICIOUS_EXCEPTIONS = None
 
+# Scanner context properties audited for suspicious exclusion patterns
+_EXCLUSION_PROPS = ("sonar.exclusions", "sonar.global.exclusions")
+
 SCANNER_VERSIONS = {
     "ScannerCLI": {
         "4.7.0": datetime.datetime(2022, 2, 22),
@@ -135,6 +147,7 @@ class Task(sq.SqObject):
     def __init__(self, task_id, endpoint, concerned_object=None, data=None):
         super().__init__(task_id, endpoint)
         self._json = data
+        self._fully_loaded = False
         self.concerned_object = concerned_object
         self._context = None
         self._error = None
@@ -156,17 +169,13 @@ class Task(sq.SqObject):
         """
         return f"{self.endpoint.url}/project/background_tasks?id={self.concerned_object.key}"
 
-    def __load(self):
-        if self._json is not None:
-            return
-        self.__load_context()
-
-    def __load_context(self, force=False):
-        if not force and self._json is not None and ("scannerContext" in self._json or not self.has_scanner_context()):
-            # Context already retrieved or not available
-            return
-        params = {"id": self.key, "additionalFields": "scannerContext,stacktrace"}
-        self._json.update(json.loads(self.get("ce/task", params=params).text)["task"])
+    def _ensure_loaded(self, with_context=False):
+        """Loads the task details, and its scanner context if requested, at most once per need"""
+        if self._json is None:
+            # The ce/task fetch always includes the scanner context, so one call covers both needs
+            self._json = dict(_fetch_task(self.endpoint, self.key))
+        elif with_context and "scannerContext" not in self._json and self._json.get("hasScannerContext", False):
+            self._json.update(_fetch_task(self.endpoint, self.key))
 
     def id(self):
         """
@@ -176,9 +185,11 @@ class Task(sq.SqObject):
         return self.key
 
     def __json_field(self, field):
-        self.__load()
-        if field not in self._json:
-            self.__load_context(force=True)
+        self._ensure_loaded()
+        if field not in self._json and not self._fully_loaded:
+            # Field not in the activity data the task was built from, re-fetch the full task once
+            self._json.update(_fetch_task(self.endpoint, self.key, force=True))
+            self._fully_loaded = True
         return self._json[field]
 
     def type(self):
@@ -214,7 +225,7 @@ class Task(sq.SqObject):
         :return: the background task submitter
         :rtype: str
         """
-        self.__load()
+        self._ensure_loaded()
         return self._json.get("submitterLogin", "anonymous")
 
     def has_scanner_context(self):
@@ -222,7 +233,7 @@ class Task(sq.SqObject):
         :return: Whether the background task has a scanner context
         :rtype: bool
         """
-        self.__load()
+        self._ensure_loaded()
         return self._json.get("hasScannerContext", False)
 
     def warnings(self):
@@ -231,7 +242,7 @@ class Task(sq.SqObject):
         :rtype: list
         """
         if not self._json.get("warnings", None):
-            data = json.loads(self.get("ce/task", params={"id": self.key, "additionalFields": "warnings"}).text)
+            data = util.json_loads(self.get("ce/task", params={"id": self.key, "additionalFields": "warnings"}).content)
             self._json["warnings"] = []
             self._json.update(data["task"])
         return self._json["warnings"]
@@ -251,27 +262,7 @@ class Task(sq.SqObject):
         :return: the background task status
         :rtype: str
         """
-        wait_time = 0
-        sleep_time = 0.5
-        params = {"status": ",".join(STATUSES), "type": self.type()}
-        if self.endpoint.version() >= (8, 0, 0):
-            params["component"] = self.component()
-        else:
-            params["q"] = self.component()
-        status = PENDING
-        while status not in (SUCCESS, FAILED, CANCELED, TIMEOUT):
-            time.sleep(sleep_time)
-            wait_time += sleep_time
-            sleep_time *= 2
-            data = json.loads(self.get("ce/activity", params=params).text)
-            for t in data["tasks"]:
-                if t["id"] != self.key:
-                    continue
-                status = t["status"]
-            if wait_time >= timeout and status not in (SUCCESS, FAILED, CANCELED):
-                status = TIMEOUT
-            util.logger.debug("%s is '%s'", str(self), status)
-        return status
+        return wait_for_completion_many([self], timeout=timeout)[self.key]
 
     def scanner_context(self):
         """
@@ -280,16 +271,23 @@ class Task(sq.SqObject):
         """
         if not self.has_scanner_context():
             return None
-        self.__load_context()
+        if self._context is not None:
+            return self._context
+        self._ensure_loaded(with_context=True)
         context_line = self._json.get("scannerContext", None)
         if context_line is None:
             return None
         context = {}
-        for line in context_line.split("\n  - "):
+        # Iterate the raw lines rather than materializing a list of split chunks,
+        # scanner contexts of large projects can be hundreds of KB
+        for raw_line in context_line.splitlines():
+            line = raw_line.lstrip(" -")
             if not line.startswith("sonar"):
                 continue
-            (prop, val) = line.split("=", 1)
-            context[prop] = val
+            (prop, eq, val) = line.partition("=")
+            if eq:
+                context[prop] = val
+        self._context = context
         return context
 
     def error_details(self):
@@ -297,7 +295,7 @@ class Task(sq.SqObject):
         :return: The background task error details
         :rtype: tuple (errorMsg (str), stackTrace (str)
         """
-        self.__load_context()
+        self._ensure_loaded(with_context=True)
         return (self._json.get("errorMessage", None), self._json.get("errorStacktrace", None))
 
     def error_message(self):
@@ -305,26 +303,18 @@ class Task(sq.SqObject):
         :return: The background task error message
         :rtype: str
         """
-        self.__load_context()
+        self._ensure_loaded(with_context=True)
         return self._json.get("errorMessage", None)
 
     def __audit_exclusions(self, exclusion_pattern, susp_exclusions, susp_exceptions):
-        problems = []
-        for susp in susp_exclusions:
-            if not re.search(rf"{susp}", exclusion_pattern):
-                continue
-            is_exception = False
-            for exception in susp_exceptions:
-                if re.search(rf"{exception}", exclusion_pattern):
-                    util.logger.debug("Exclusion %s matches exception %s, no audit problem will be raised", exclusion_pattern, exception)
-                    is_exception = True
-                    break
-            if not is_exception:
-                rule = rules.get_rule(rules.RuleId.PROJ_SUSPICIOUS_EXCLUSION)
-                msg = rule.msg.format(str(self.concerned_object), exclusion_pattern)
-                problems.append(problem.Problem(rule.type, rule.severity, msg, concerned_object=self.concerned_object))
-                break  # Report only on the 1st suspicious match
-        return problems
+        if susp_exclusions is None or not susp_exclusions.search(exclusion_pattern):
+            return []
+        if susp_exceptions is not None and susp_exceptions.search(exclusion_pattern):
+            util.logger.debug("Exclusion %s matches an exception pattern, no audit problem will be raised", exclusion_pattern)
+            return []
+        rule = rules.get_rule(rules.RuleId.PROJ_SUSPICIOUS_EXCLUSION)
+        msg = rule.msg.format(str(self.concerned_object), exclusion_pattern)
+        return [problem.Problem(rule.type, rule.severity, msg, concerned_object=self.concerned_object)]
 
     def __audit_disabled_scm(self, audit_settings, scan_context):
         if not audit_settings.get("audit.project.scm.disabled", True):
@@ -421,16 +411,19 @@ class Task(sq.SqObject):
         util.logger.debug("Auditing %s", str(self))
         problems = []
         if self.has_scanner_context():
-            problems = []
-            context = self.scanner_context()
+            # A task can advertise a scanner context but not carry one (e.g. redacted response)
+            context = self.scanner_context() or {}
             susp_exclusions = _get_suspicious_exclusions(audit_settings.get("audit.projects.suspiciousExclusionsPatterns", ""))
             susp_exceptions = _get_suspicious_exceptions(audit_settings.get("audit.projects.suspiciousExclusionsExceptions", ""))
-            for prop in ("sonar.exclusions", "sonar.global.exclusions"):
-                if context.get(prop, None) is None:
-                    continue
-                for excl in util.csv_to_list(context[prop]):
-                    util.logger.debug("Pattern = '%s'", excl)
-                    problems += self.__audit_exclusions(excl, susp_exclusions, susp_exceptions)
+            if susp_exclusions is not None:
+                # No suspicious patterns configured means nothing to scan exclusions for
+                for prop in _EXCLUSION_PROPS:
+                    val = context.get(prop, None)
+                    if not val:
+                        continue
+                    for excl in (x.strip() for x in val.split(",")):
+                        util.logger.debug("Pattern = '%s'", excl)
+                        problems += self.__audit_exclusions(excl, susp_exclusions, susp_exceptions)
             problems += self.__audit_disabled_scm(audit_settings, context)
         elif type(self.concerned_object).__name__ == "Project":
             util.logger.debug("Last background task of %s has no scanner context, can't audit it", str(self.concerned_object))
@@ -442,22 +435,95 @@ class Task(sq.SqObject):
         return problems
 
 
-def search(endpoint, only_current=False, component_key=None):
+_TASK_CACHE = {}
+
+
+def _fetch_task(endpoint, task_id, force=False):
+    """Fetches the ce/task details of a task, cached across Task objects of the same platform and id"""
+    cache_key = (endpoint.url, task_id)
+    if force or cache_key not in _TASK_CACHE:
+        params = {"id": task_id, "additionalFields": "scannerContext,stacktrace"}
+        _TASK_CACHE[cache_key] = util.json_loads(endpoint.get("ce/task", params=params).content)["task"]
+    return _TASK_CACHE[cache_key]
+
+
+def clear_cache():
+    """Clears the cache of ce/task details
+
+    :return: Nothing
+    """
+    _TASK_CACHE.clear()
+
+
+def wait_for_completion_many(task_list, timeout=180):
+    """Waits for several background tasks to complete, with a single ce/activity poll per tick
+
+    :param task_list: Background tasks to wait for, all belonging to the same platform
+    :type task_list: list[Task]
+    :param timeout: Timeout to wait in seconds, defaults to 180
+    :type timeout: int, optional
+    :return: the status of each background task
+    :rtype: dict{<task key>: <status>}
+    """
+    statuses = {t.key: PENDING for t in task_list}
+    if not task_list:
+        return statuses
+    endpoint = task_list[0].endpoint
+    single_task_id = task_list[0].key if len(task_list) == 1 else None
+    if single_task_id is None:
+        params = {"status": _STATUSES_JOINED, "onlyCurrents": "false", "ps": 500}
+    pending = set(statuses.keys())
+    # A monotonic deadline keeps the timeout accurate even when the HTTP polls themselves are slow
+    deadline = time.monotonic() + timeout
+    sleep_time = _POLL_INITIAL_INTERVAL
+    while pending:
+        # Clamp the nap to the remaining timeout budget so the wait can't overshoot
+        nap = max(0.0, sleep_time + random.uniform(-_POLL_JITTER, _POLL_JITTER))
+        time.sleep(min(nap, max(deadline - time.monotonic(), 0)))
+        sleep_time = min(sleep_time * _POLL_BACKOFF_FACTOR, _POLL_MAX_INTERVAL)
+        if single_task_id is not None:
+            # ce/task returns the one task directly, a much smaller payload than an activity page
+            task_json = util.json_loads(endpoint.get("ce/task", params={"id": single_task_id}).content)["task"]
+            found = {task_json["id"]: task_json["status"]}
+        else:
+            data = util.json_loads(endpoint.get("ce/activity", params=params).content)
+            found = {t["id"]: t["status"] for t in data["tasks"]}
+        for key in list(pending):
+            new_status = found.get(key, statuses[key])
+            if new_status != statuses[key]:
+                # State change (e.g. PENDING -> IN_PROGRESS): poll fast again
+                statuses[key] = new_status
+                sleep_time = _POLL_INITIAL_INTERVAL
+            if new_status in (SUCCESS, FAILED, CANCELED):
+                pending.remove(key)
+        if time.monotonic() >= deadline and pending:
+            for key in pending:
+                statuses[key] = TIMEOUT
+            break
+        util.logger.debug("Still waiting for %d background task(s), statuses %s", len(pending), str(statuses))
+    return statuses
+
+
+def search(endpoint, only_current=False, component_key=None, ps=None):
     """Searches background tasks
 
     :param Platform endpoint: Reference to the SonarQube platform
     :param only_current: only the most recent background task of each object, defaults to False
     :param component_key: filter for a given component key only, defaults to None
     :param component_key: str, optional
+    :param ps: page size, ie maximum number of tasks to return, defaults to None (API default)
+    :type ps: int, optional
     :return: The list of found background tasks
     :rtype: list[Task]
     """
-    params = {"status": ",".join(STATUSES), "additionalFields": "warnings"}
+    params = {"status": _STATUSES_JOINED, "additionalFields": "warnings"}
     if only_current:
         params["onlyCurrents"] = "true"
     if component_key is not None:
         params["component"] = component_key
-    data = json.loads(endpoint.get("ce/activity", params=params).text)
+    if ps is not None:
+        params["ps"] = ps
+    data = util.json_loads(endpoint.get("ce/activity", params=params).content)
     task_list = []
     for t in data["tasks"]:
         task_list.append(Task(t["id"], endpoint, data=t))
@@ -469,7 +535,8 @@ def search_all_last(component_key=None, endpoint=None):
 
 
 def search_last(component_key, endpoint=None):
-    bg_tasks = search(only_current=True, component_key=component_key, endpoint=endpoint)
+    # Only the most recent task is needed, don't make the server return more
+    bg_tasks = search(only_current=True, component_key=component_key, endpoint=endpoint, ps=1)
     if bg_tasks is None or not bg_tasks:
         # No bgtask was found
         return None
@@ -480,19 +547,25 @@ def search_all(component_key, endpoint=None):
     return search(component_key=component_key, endpoint=endpoint)
 
 
+def _compile_alternation(patterns):
+    """Combines a list of pattern strings into a single compiled alternation, None if the list is empty"""
+    pattern_list = util.csv_to_list(patterns)
+    if not pattern_list:
+        return None
+    return re.compile("|".join(f"(?:{p})" for p in pattern_list))
+
+
 def _get_suspicious_exclusions(patterns):
     global __SUSPICIOUS_EXCLUSIONS
-    if __SUSPICIOUS_EXCLUSIONS is not None:
-        return __SUSPICIOUS_EXCLUSIONS
-    # __SUSPICIOUS_EXCLUSIONS = [x.strip().replace('*', '\\*').replace('.', '\\.').replace('?', '\\?')
-    __SUSPICIOUS_EXCLUSIONS = util.csv_to_list(patterns)
+    if __SUSPICIOUS_EXCLUSIONS is None:
+        # Patterns are compiled once into a single alternation and cached,
+        # the audit loop runs it on every exclusion of every project
+        __SUSPICIOUS_EXCLUSIONS = _compile_alternation(patterns)
     return __SUSPICIOUS_EXCLUSIONS
 
 
 def _get_suspicious_exceptions(patterns):
     global __SUSPICIOUS_EXCEPTIONS
-    if __SUSPICIOUS_EXCEPTIONS is not None:
-        return __SUSPICIOUS_EXCEPTIONS
-    #    __SUSPICIOUS_EXCEPTIONS = [x.strip().replace('*', '\\*').replace('.', '\\.').replace('?', '\\?')
-    __SUSPICIOUS_EXCEPTIONS = util.csv_to_list(patterns)
+    if __SUSPICIOUS_EXCEPTIONS is None:
+        __SUSPICIOUS_EXCEPTIONS = _compile_alternation(patterns)
     return __SUSPICIOUS_EXCEPTIONS
@@ -18,7 +18,6 @@
 # Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
 #
 
-import json
 import sonar.sqobject as sq
 import sonar.utilities as util
 
@@ -78,7 +77,7 @@ def search(endpoint, login):
     :return: list of tokens
     :rtype: list[UserToken]
     """
-    data = json.loads(endpoint.get(UserToken.API_SEARCH, {"login": login}).text)
+    data = endpoint.get(UserToken.API_SEARCH, {"login": login}).json()
     token_list = []
     for tk in data["userTokens"]:
         token_list.append(UserToken(login=data["login"], json_data=tk, endpoint=endpoint))
@@ -90,5 +89,5 @@ def generate(name, endpoint, login=None):
     :return: the generated Token object
     :rtype: Token
     """
-    data = json.loads(endpoint.post(UserToken.API_GENERATE, {"name": name, "login": login}).text)
+    data = endpoint.post(UserToken.API_GENERATE, {"name": name, "login": login}).json()
     return UserToken(endpoint=endpoint, login=data["login"], name=data["name"], created_at=data["createdAt"], token=data["token"])
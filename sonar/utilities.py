@@ -32,6 +32,13 @@ import argparse
 import json
 import datetime
 import pytz
+
+try:
+    # Optional dependency (pip install sonar-tools[fast]), much faster on large JSON payloads
+    import orjson
+except ImportError:
+    orjson = None
+
 from sonar import options
 
 OPT_VERBOSE = "verbosity"
@@ -47,6 +54,11 @@ SQ_TIME_FORMAT = "%H:%M:%S"
 
 CSV_SEPARATOR = ","
 
+_REDACT_SQ_TOKEN = re.compile(r"(......).*(..)")
+_REDACT_OTHER_TOKEN = re.compile(r"(..).*(..)")
+
+_JVM_XMX = re.compile(r"-Xmx(\d+)([kmgKMG])")
+
 logger = logging.getLogger("sonar-tools")
 formatter = logging.Formatter("%(asctime)s | %(name)s | %(levelname)-7s | %(threadName)-15s | %(message)s")
 fh = logging.FileHandler("sonar-tools.log")
@@ -220,7 +232,9 @@ def check_token(token):
 
 
 def json_dump_debug(json_data, pre_string=""):
-    logger.debug("%s%s", pre_string, json_dump(json_data))
+    # Only serialize the JSON if the debug log is going to be written
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("%s%s", pre_string, json_dump(json_data))
 
 
 def format_date_ymd(year, month, day):
@@ -268,9 +282,9 @@ def redacted_token(token):
     if token is None:
         return "-"
     if token[0:4] in ("squ_", "sqa_", "sqp_"):
-        return re.sub(r"(......).*(..)", r"\1***\2", token)
+        return _REDACT_SQ_TOKEN.sub(r"\1***\2", token)
     else:
-        return re.sub(r"(..).*(..)", r"\1***\2", token)
+        return _REDACT_OTHER_TOKEN.sub(r"\1***\2", token)
 
 
 def convert_to_type(value):
@@ -307,6 +321,18 @@ def json_dump(jsondata, indent=3):
     return json.dumps(remove_nones(jsondata), indent=indent, sort_keys=True, separators=(",", ": "))
 
 
+def json_loads(data):
+    """Parses a JSON string or bytes, with orjson when installed
+
+    :param data: The JSON document, as str or bytes
+    :return: The parsed document
+    :rtype: dict or list
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 def str_none(v):
     if v is None:
         return ""
@@ -361,23 +387,20 @@ def quote(string, sep):
 
 
 def jvm_heap(cmdline):
-    for s in cmdline.split(" "):
-        if not re.match("-Xmx", s):
-            continue
-        try:
-            val = int(s[4:-1])
-            unit = s[-1].upper()
-            if unit == "M":
-                return val
-            elif unit == "G":
-                return val * 1024
-            elif unit == "K":
-                return val // 1024
-        except ValueError:
+    m = _JVM_XMX.search(cmdline)
+    if m is None:
+        if "-Xmx" in cmdline:
             logger.warning("JVM -Xmx heap specified seems invalid in '%s'", cmdline)
-            return None
-    logger.warning("No JVM heap memory settings specified in '%s'", cmdline)
-    return None
+        else:
+            logger.warning("No JVM heap memory settings specified in '%s'", cmdline)
+        return None
+    val = int(m.group(1))
+    unit = m.group(2).upper()
+    if unit == "M":
+        return val
+    elif unit == "G":
+        return val * 1024
+    return val // 1024
 
 
 def int_memory(string):
@@ -480,7 +503,7 @@ def search_by_name(endpoint, name, api, returned_field, extra_params=None):
     params = {"q": name}
     if extra_params is not None:
         params.update(extra_params)
-    data = json.loads(endpoint.get(api, params=params).text)
+    data = endpoint.get(api, params=params).json()
     for d in data[returned_field]:
         if d["name"] == name:
             return d
@@ -491,7 +514,7 @@ def search_by_key(endpoint, key, api, returned_field, extra_params=None):
     params = {"q": key}
     if extra_params is not None:
         params.update(extra_params)
-    data = json.loads(endpoint.get(api, params=params).text)
+    data = endpoint.get(api, params=params).json()
     for d in data[returned_field]:
         if d["key"] == key:
             return d
@@ -504,8 +527,9 @@ def log_and_exit(response):
     tool_msg = f"For request URL {response.request.url}\n"
     code = response.status_code
     try:
-        sq_msg = " | ".join([e["msg"] for e in json.loads(response.text)["errors"]])
-    except json.decoder.JSONDecodeError:
+        sq_msg = " | ".join([e["msg"] for e in response.json()["errors"]])
+    except ValueError:
+        # Not all JSON decoders raise json.decoder.JSONDecodeError, but all raise ValueError subclasses
         sq_msg = ""
 
     if code == HTTPStatus.UNAUTHORIZED:
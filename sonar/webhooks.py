@@ -18,7 +18,6 @@
 # Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
 #
 
-import json
 import sonar.utilities as util
 import sonar.sqobject as sq
 
@@ -38,7 +37,7 @@ class WebHook(sq.SqObject):
         super().__init__(name, endpoint)
         if data is None:
             params = util.remove_nones({"name": name, "url": url, "secret": secret, "project": project})
-            data = json.loads(self.post("webhooks/create", params=params).text)["webhook"]
+            data = self.post("webhooks/create", params=params).json()["webhook"]
         self._json = data
         self.name = data["name"]  #: Webhook name
         self.key = data["key"]  #: Webhook key